@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -12,7 +13,7 @@ from datetime import datetime, timezone
 
 from .sync import BranchRepo
 from .drive import login as drive_login
-from .drive import list_docs, iter_revisions
+from .drive import get_doc_title, iter_revisions
 from .utils import slugify
 
 import webbrowser
@@ -21,6 +22,46 @@ import re
 import tempfile
 import subprocess
 import html
+import functools
+from typing import Iterator, Sequence
+
+try:  # C-backed parser is ~10x faster on large Google-Doc exports.
+    import lxml  # type: ignore  # noqa: F401
+
+    _BS4_PARSER = "lxml"
+except ImportError:  # pragma: no cover – optional dependency
+    _BS4_PARSER = "html.parser"
+
+
+try:  # selectolax extracts text without building a Python-level tree.
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser  # type: ignore
+except ImportError:  # pragma: no cover – optional dependency
+    try:  # selectolax < 1.0 only ships the Modest backend
+        from selectolax.parser import HTMLParser as _FastHTMLParser  # type: ignore
+    except ImportError:
+        _FastHTMLParser = None
+
+# Identifies which extractor produced cached text (see _blob_text_lines):
+# backends split lines differently, so their results must never be mixed.
+_TEXT_BACKEND = "selectolax" if _FastHTMLParser is not None else f"bs4-{_BS4_PARSER}"
+
+
+def _soup(src: str | bytes):  # noqa: D401 – util
+    """Parse *src* with the fastest available BeautifulSoup backend."""
+
+    from bs4 import BeautifulSoup  # type: ignore
+
+    if isinstance(src, bytes):
+        # Exports are always UTF-8; skip the charset-detection pass.
+        return BeautifulSoup(src, _BS4_PARSER, from_encoding="utf-8")
+    return BeautifulSoup(src, _BS4_PARSER)
+
+
+# Regex fallbacks used when no HTML parser is installed.
+_STYLE_RE = re.compile(r"<style.*?</style>", re.DOTALL | re.IGNORECASE)
+_SCRIPT_RE = re.compile(r"<script.*?</script>", re.DOTALL | re.IGNORECASE)
+_ATTRS_RE = re.compile(r"<([a-zA-Z0-9]+)(\s[^>]*)?>")
+_TAG_RE = re.compile(r"<[^>]+>")
 
 # ------------------------------------------------------------------
 # Paragraph-level visual diff
@@ -35,22 +76,45 @@ import html
 def _clean_html(src: str) -> list[str]:
     """Return list of cleaned HTML lines suitable for HtmlDiff."""
 
+    cleaned: str | None = None
     try:
-        from bs4 import BeautifulSoup  # type: ignore
+        import lxml.html  # type: ignore
+        from lxml.etree import ParserError  # type: ignore
+        from lxml.html.clean import Cleaner  # type: ignore
+    except ImportError:
+        pass
+    else:
+        # Single C-level pass: drop style / script blocks and *all* attributes,
+        # leaving every other element (forms, iframes, comments…) in place.
+        cleaner = Cleaner(
+            scripts=True,
+            javascript=False,
+            comments=False,
+            style=True,
+            links=False,
+            meta=False,
+            page_structure=False,
+            processing_instructions=False,
+            embedded=False,
+            frames=False,
+            forms=False,
+            annoying_tags=False,
+            remove_unknown_tags=False,
+            safe_attrs_only=True,
+            safe_attrs=frozenset(),
+        )
+        try:
+            tree = cleaner.clean_html(lxml.html.document_fromstring(src))
+        except ParserError:
+            pass  # empty / whitespace- or comment-only document
+        else:
+            cleaned = lxml.html.tostring(tree, pretty_print=True, encoding="unicode")
 
-        soup = BeautifulSoup(src, "html.parser")
-        # Drop style / script blocks completely.
-        for tag in soup(["style", "script"]):
-            tag.decompose()
-        # Remove all attributes from remaining elements.
-        for tag in soup.find_all(True):
-            tag.attrs = {}
-        cleaned = soup.prettify()
-    except Exception:
+    if cleaned is None:
         # Regex fallback – remove style/script blocks and attributes.
-        cleaned = re.sub(r"<style.*?</style>", "", src, flags=re.DOTALL | re.IGNORECASE)
-        cleaned = re.sub(r"<script.*?</script>", "", cleaned, flags=re.DOTALL | re.IGNORECASE)
-        cleaned = re.sub(r"<([a-zA-Z0-9]+)(\s[^>]*)?>", r"<\1>", cleaned)
+        cleaned = _STYLE_RE.sub("", src)
+        cleaned = _SCRIPT_RE.sub("", cleaned)
+        cleaned = _ATTRS_RE.sub(r"<\1>", cleaned)
 
     return cleaned.splitlines()
 
@@ -121,8 +185,7 @@ def _cmd_import_drive(args: argparse.Namespace) -> None:  # noqa: D401 – CLI e
 
     # We need the doc title first – fetch once via files.get.
     try:
-        docs = {f["id"]: f["name"] for f in list_docs()}
-        title = docs.get(args.file_id)
+        title = get_doc_title(args.file_id)
     except Exception as exc:  # pragma: no cover – network path
         sys.exit(f"error fetching doc metadata: {exc}")
 
@@ -165,6 +228,197 @@ def _cmd_import_drive(args: argparse.Namespace) -> None:  # noqa: D401 – CLI e
 # ------------------------------------------------------------------
 
 
+def _html_to_text(src: str) -> list[str]:
+    """Return the visible text of *src* split into lines."""
+
+    if _FastHTMLParser is not None:
+        tree = _FastHTMLParser(src)
+        tree.strip_tags(["style", "script"])
+        root = tree.body if tree.body is not None else tree.root
+        return root.text(separator="\n").splitlines() if root is not None else []
+
+    try:
+        soup = _soup(src)
+        for tag in soup(["style", "script"]):
+            tag.decompose()
+        text = soup.get_text()
+    except Exception:
+        text = _TAG_RE.sub("", src)
+    return text.splitlines()
+
+
+# Extracted text lives next to the objects it was derived from so it never
+# shows up as an untracked file in the work-tree.
+_TEXT_CACHE_DIR = "branch-cache"
+
+
+@functools.lru_cache(maxsize=64)
+def _blob_text_lines(blob) -> tuple[str, ...]:  # noqa: D401 – util
+    """Return ``_html_to_text`` of a Git *blob*, memoised by its SHA.
+
+    Blobs are immutable, so results are also kept on disk under
+    ``.git/branch-cache/<backend>/<hexsha>.txt`` and reused across CLI
+    invocations (unless the cache predates this module).
+    """
+
+    cache_path = (
+        Path(blob.repo.git_dir) / _TEXT_CACHE_DIR / _TEXT_BACKEND / f"{blob.hexsha}.txt"
+    )
+    try:
+        if cache_path.stat().st_mtime >= Path(__file__).stat().st_mtime:
+            return tuple(cache_path.read_text(encoding="utf-8").split("\n")[:-1])
+    except OSError:
+        pass
+
+    lines = _html_to_text(blob.data_stream.read().decode())
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so an interrupted run never leaves a truncated
+        # entry behind that later diffs would trust.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write("".join(f"{line}\n" for line in lines))
+        os.replace(tmp.name, cache_path)
+    except OSError:  # pragma: no cover – read-only repo, cache is optional
+        pass
+    return tuple(lines)
+
+
+_HUNK_RE = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@$")
+
+
+def _unified_diff(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    fromfile: str,
+    tofile: str,
+    n: int = 3,
+) -> Iterator[str]:
+    """``difflib.unified_diff`` that skips the common prefix / suffix.
+
+    Consecutive revisions usually share most of their lines, so only the
+    differing middle (plus *n* lines of context) is handed to difflib; hunk
+    headers are shifted back to absolute line numbers.
+    """
+
+    end = min(len(old_lines), len(new_lines))
+    i = 0
+    while i < end and old_lines[i] == new_lines[i]:
+        i += 1
+    j = 0
+    while j < end - i and old_lines[-1 - j] == new_lines[-1 - j]:
+        j += 1
+
+    # Keep enough shared lines around the change for identical context.
+    i = max(i - n, 0)
+    j = max(j - n, 0)
+
+    hunks = difflib.unified_diff(
+        old_lines[i : len(old_lines) - j],
+        new_lines[i : len(new_lines) - j],
+        fromfile=fromfile,
+        tofile=tofile,
+        n=n,
+        lineterm="",
+    )
+    for line in hunks:
+        m = _HUNK_RE.match(line) if i else None
+        if m:
+            line = (
+                f"@@ -{int(m.group(1)) + i}{m.group(2) or ''} "
+                f"+{int(m.group(3)) + i}{m.group(4) or ''} @@"
+            )
+        yield line
+
+
+def _histogram_diff(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    fromfile: str,
+    tofile: str,
+) -> str:
+    """Return a unified diff computed by ``git diff --no-index --histogram``.
+
+    Git's histogram algorithm (C, libxdiff) is faster than difflib and yields
+    more readable hunks on reflowed documents.  Falls back to
+    :func:`_unified_diff` when ``git`` cannot be run.
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for name, lines in (("old", old_lines), ("new", new_lines)):
+            path = Path(tmp_dir, name)
+            path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+            paths.append(str(path))
+
+        try:
+            proc = subprocess.run(
+                [
+                    "git",
+                    "diff",
+                    "--no-index",
+                    "--no-color",
+                    "--no-ext-diff",
+                    "--text",
+                    "--histogram",
+                    "--unified=3",
+                    *paths,
+                ],
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError:
+            proc = None
+
+    # Exit status 1 just means "files differ".
+    if proc is None or proc.returncode not in (0, 1):
+        return "\n".join(_unified_diff(old_lines, new_lines, fromfile, tofile))
+
+    # Swap git's temp-file headers for the commit labels difflib would use.
+    first_hunk = proc.stdout.find("\n@@")
+    if first_hunk < 0:
+        return ""
+    body = proc.stdout[first_hunk + 1 :].rstrip("\n")
+    return f"--- {fromfile}\n+++ {tofile}\n{body}"
+
+
+def _dmp_diff_html(
+    old_lines: Sequence[str],
+    new_lines: Sequence[str],
+    fromdesc: str,
+    todesc: str,
+) -> str | None:
+    """Render a line-mode *diff-match-patch* diff as a standalone HTML page.
+
+    Returns ``None`` when the optional ``diff-match-patch`` package is not
+    installed so callers can fall back to the unified-diff renderers.
+    """
+
+    try:
+        from diff_match_patch import diff_match_patch  # type: ignore
+    except ImportError:
+        return None
+
+    dmp = diff_match_patch()
+    old = "".join(f"{line}\n" for line in old_lines)
+    new = "".join(f"{line}\n" for line in new_lines)
+
+    # Diff whole lines (one char per unique line), then expand back.
+    chars1, chars2, line_array = dmp.diff_linesToChars(old, new)
+    diffs = dmp.diff_main(chars1, chars2, False)
+    dmp.diff_charsToLines(diffs, line_array)
+    dmp.diff_cleanupSemantic(diffs)
+
+    title = html.escape(f"{fromdesc}..{todesc}")
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        f"<title>{title}</title></head>"
+        f"<body><h3>{title}</h3>{dmp.diff_prettyHtml(diffs)}</body></html>\n"
+    )
+
+
 def _open_latest_diff(repo: BranchRepo, slug: str) -> None:
     """Generate HTML diff for the last two commits of *slug* and open it."""
 
@@ -178,57 +432,36 @@ def _open_latest_diff(repo: BranchRepo, slug: str) -> None:
     latest, previous = log[0], log[1]
     a = previous.tree / doc_path
     b = latest.tree / doc_path
-    html_a = a.data_stream.read().decode()
-    html_b = b.data_stream.read().decode()
+    old_lines = _blob_text_lines(a)
+    new_lines = _blob_text_lines(b)
 
-    def _html_to_text(src: str) -> list[str]:
-        try:
-            from bs4 import BeautifulSoup  # type: ignore
-
-            soup = BeautifulSoup(src, "html.parser")
-            for tag in soup(["style", "script"]):
-                tag.decompose()
-            text = soup.get_text()
-        except Exception:
-            text = re.sub(r"<[^>]+>", "", src)
-        return text.splitlines()
-
-    old_lines = _html_to_text(html_a)
-    new_lines = _html_to_text(html_b)
-
-    patch_text = "\n".join(
-        difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=previous.hexsha[:7],
-            tofile=latest.hexsha[:7],
-            lineterm="",
-        )
-    )
+    html_out = _dmp_diff_html(old_lines, new_lines, previous.hexsha[:7], latest.hexsha[:7])
+    if html_out is None:
+        patch_text = _histogram_diff(old_lines, new_lines, previous.hexsha[:7], latest.hexsha[:7])
 
-    # Pass through diff2html (requires npm install -g diff2html-cli)
-    try:
-        html_out = subprocess.check_output(
-            [
-                "diff2html",
-                "-i",
-                "stdin",
-                "-o",
-                "stdout",
-                "--style",
-                "line",
-            ],
-            input=patch_text,
-            text=True,
-        )
-    except FileNotFoundError:
-        print("diff2html CLI not found. Falling back to simple HtmlDiff.")
-        html_out = difflib.HtmlDiff(wrapcolumn=120).make_file(
-            old_lines,
-            new_lines,
-            fromdesc=previous.hexsha[:7],
-            todesc=latest.hexsha[:7],
-        )
+        # Highlight in-process with pygments – no Node.js start-up per sync.
+        try:
+            from pygments import highlight  # type: ignore
+            from pygments.formatters import HtmlFormatter  # type: ignore
+            from pygments.lexers import DiffLexer  # type: ignore
+        except ImportError:
+            print("pygments not installed. Falling back to simple HtmlDiff.")
+            html_out = difflib.HtmlDiff(wrapcolumn=120).make_file(
+                old_lines,
+                new_lines,
+                fromdesc=previous.hexsha[:7],
+                todesc=latest.hexsha[:7],
+            )
+        else:
+            html_out = highlight(
+                patch_text,
+                DiffLexer(),
+                HtmlFormatter(
+                    full=True,
+                    style="github-dark",
+                    title=f"{previous.hexsha[:7]}..{latest.hexsha[:7]}",
+                ),
+            )
 
     with tempfile.NamedTemporaryFile("w", delete=False, suffix=".html") as tmp:
         tmp.write(html_out)
@@ -240,8 +473,7 @@ def _open_latest_diff(repo: BranchRepo, slug: str) -> None:
 def _cmd_sync(args: argparse.Namespace) -> None:  # noqa: D401 – CLI entry
     # Determine repo path first (same logic as import-drive default tweak)
     try:
-        docs = {f["id"]: f["name"] for f in list_docs()}
-        title = docs.get(args.file_id)
+        title = get_doc_title(args.file_id)
     except Exception:
         title = None
 
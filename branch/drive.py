@@ -7,8 +7,13 @@ friendly hint if the required Google libraries are missing.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any, Iterator, List, Tuple
 
@@ -17,6 +22,11 @@ SCOPES: list[str] = [
     "https://www.googleapis.com/auth/drive.metadata.readonly",
 ]
 
+_DOC_MIME = "application/vnd.google-apps.document"
+
+# Concurrent revision downloads in :func:`iter_revisions`.
+_FETCH_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -105,10 +115,14 @@ def _drive_service():
 
 
 def list_docs() -> List[dict[str, Any]]:
-    """Return all non-trashed Google Docs visible to the user."""
+    """Return all non-trashed Google Docs visible to the user.
+
+    To resolve a single document use :func:`get_doc_title`, which costs one
+    request regardless of account size.
+    """
 
     service = _drive_service()
-    q = "mimeType='application/vnd.google-apps.document' and trashed = false"
+    q = f"mimeType='{_DOC_MIME}' and trashed = false"
     fields = "nextPageToken, files(id, name)"
 
     files: list[dict[str, Any]] = []
@@ -126,10 +140,42 @@ def list_docs() -> List[dict[str, Any]]:
     return files
 
 
+@functools.lru_cache(maxsize=16)
+def get_doc_title(file_id: str) -> str | None:
+    """Return the title of Google Doc *file_id*, or ``None`` if unavailable.
+
+    A single ``files.get`` round-trip, independent of how many docs the
+    account holds – prefer this over scanning :func:`list_docs`.  Trashed
+    files and non-Docs are reported as ``None`` just like a missing file.
+    """
+
+    service = _drive_service()
+    from googleapiclient.errors import HttpError  # noqa: WPS433 – dynamic import
+
+    try:
+        meta = (
+            service.files()
+            .get(fileId=file_id, fields="name, mimeType, trashed")
+            .execute()
+        )
+    except HttpError as err:  # pragma: no cover – network path
+        if err.resp.status == 404:
+            return None
+        raise
+
+    if meta.get("mimeType") != _DOC_MIME or meta.get("trashed"):
+        return None
+    return meta.get("name")
+
+
 def iter_revisions(
     file_id: str,
 ) -> Iterator[Tuple[str, bytes, str, str]]:
-    """Yield (revisionId, html_bytes, modifiedTimeISO, authorEmail)."""
+    """Yield (revisionId, html_bytes, modifiedTimeISO, authorEmail).
+
+    Exports are downloaded concurrently (at most ``_FETCH_WORKERS`` at a time)
+    but still yielded oldest-first.
+    """
 
     service = _drive_service()
 
@@ -144,37 +190,59 @@ def iter_revisions(
         .execute()
     )
 
-    # Google returns newest-first; we want oldest-first for chronological commits.
-    for rev in sorted(meta.get("revisions", []), key=lambda r: r["modifiedTime"]):
+    _lazy_import()  # to get HttpError safely
+    from googleapiclient.errors import HttpError  # noqa: WPS433 – dynamic import
+
+    # Neither the discovery client nor httplib2 is thread-safe, so every
+    # worker thread lazily builds its own authorised service.
+    local = threading.local()
+
+    def _fetch(rev: dict[str, Any]) -> Tuple[str, bytes, str, str] | None:
+        svc = getattr(local, "service", None)
+        if svc is None:
+            svc = local.service = _drive_service()
+
         rev_id = rev["id"]
         email = rev.get("lastModifyingUser", {}).get("emailAddress", "unknown@example.com")
 
-        Credentials, InstalledAppFlow, build = _lazy_import()  # to get HttpError safely
-        from googleapiclient.errors import HttpError  # noqa: WPS433 – dynamic import
-
         try:
             # Obtain export link for HTML for this revision.
             rev_meta = (
-                service.revisions()
+                svc.revisions()
                 .get(fileId=file_id, revisionId=rev_id, fields="exportLinks")
                 .execute()
             )
 
             html_url = rev_meta.get("exportLinks", {}).get("text/html")
             if not html_url:
-                continue  # cannot export – skip
+                return None  # cannot export – skip
 
-            http = service._http  # authorised httplib2.Http object
+            http = svc._http  # authorised httplib2.Http object
             resp, export = http.request(html_url)
             if resp.status != 200:
-                continue
-        except HttpError as err:  # pragma: no cover – network path
-            if err.resp.status == 404:
-                continue
-            raise
+                return None
         except HttpError as err:  # pragma: no cover – network path
             if err.resp.status == 404:  # revision not found (rare but documented)
-                continue
+                return None
             raise
 
-        yield rev_id, export, rev["modifiedTime"], email
+        return rev_id, export, rev["modifiedTime"], email
+
+    # Google returns newest-first; we want oldest-first for chronological commits.
+    revisions = iter(sorted(meta.get("revisions", []), key=lambda r: r["modifiedTime"]))
+
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        # Bounded look-ahead keeps memory flat if the consumer is slow.
+        pending = deque(
+            pool.submit(_fetch, rev) for rev in islice(revisions, 2 * _FETCH_WORKERS)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for rev in islice(revisions, 1):
+                    pending.append(pool.submit(_fetch, rev))
+                if result is not None:
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
@@ -9,11 +9,13 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import io
 import os
 import re
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
 
 from git import Repo, Actor, GitCommandError
 
@@ -21,7 +23,7 @@ from .utils import slugify
 
 
 # Pattern solely matching *inside* the attribute value so that we can safely
-# run a simple ``re.sub`` without having to reconstruct the whole ``<img>``
+# splice in the replacement without having to reconstruct the whole ``<img>``
 # element.
 
 _DATA_URI_RE = re.compile(
@@ -29,6 +31,24 @@ _DATA_URI_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Cheap superset of ``_DATA_URI_RE`` (same case-insensitivity) used to bail
+# out early on documents without inline images.
+_DATA_URI_PROBE_RE = re.compile(r":(?i:image/)")
+
+# Links written by :func:`normalise_html`.
+_BLOB_REF_RE = re.compile(r"blobs/([0-9a-f]{64})")
+
+# Sidecar hashes of each doc.html, kept inside ``.git`` so they never show up
+# in the work-tree.
+_HASH_CACHE_DIR = os.path.join("branch-cache", "hashes")
+
+# Base64 characters decoded per step; a multiple of 4 so every window except
+# the last one is a complete quantum (3 KiB of raw bytes).
+_B64_CHUNK = 4096
+
+# Permission bits for blob files: what ``write_bytes`` gives under umask 022.
+_BLOB_MODE = 0o644
+
 
 def normalise_html(html: str, blobs_dir: os.PathLike[str] | str) -> Tuple[str, list[Path]]:
     """Return a tuple ``(clean_html, written_paths)``.
@@ -40,29 +60,78 @@ def normalise_html(html: str, blobs_dir: os.PathLike[str] | str) -> Tuple[str, l
     are **not** duplicated.
     """
 
+    # Most revisions carry no inline images: probing for the case-sensitive
+    # ":" anchor lets the regex engine skip ahead with a literal scan, far
+    # cheaper than running the full pattern over the whole document.
+    if _DATA_URI_PROBE_RE.search(html) is None:
+        return html, []
+
     blobs_dir_path = Path(blobs_dir)
     blobs_dir_path.mkdir(parents=True, exist_ok=True)
 
     written: list[Path] = []
 
     def _replace(match: re.Match[str]) -> str:  # noqa: D401 – inner helper
-        b64_payload = match.group(1)
+        start, end = match.span(1)
 
+        # Decode window by window so peak memory stays O(chunk) even for
+        # multi-megabyte images.
+        def _chunks() -> Iterator[bytes]:
+            for pos in range(start, end, _B64_CHUNK):
+                yield base64.b64decode(html[pos : min(pos + _B64_CHUNK, end)])
+
+        # First pass only hashes: from the second revision on the blob
+        # usually exists already and nothing needs writing.
+        hasher = hashlib.sha256()
         try:
-            raw = base64.b64decode(b64_payload)
+            for raw in _chunks():
+                hasher.update(raw)
         except base64.binascii.Error:
             return match.group(0)  # Unable to decode – leave untouched.
 
-        digest = hashlib.sha256(raw).hexdigest()
+        digest = hasher.hexdigest()
         blob_path = blobs_dir_path / digest
-
-        if not blob_path.exists():
-            blob_path.write_bytes(raw)
+        if blob_path.exists():
+            return f"blobs/{digest}"
+
+        # Second pass streams the payload into a temp file next to the target.
+        tmp = tempfile.NamedTemporaryFile(dir=blobs_dir_path, prefix=".tmp-", delete=False)
+        with tmp:
+            for raw in _chunks():
+                tmp.write(raw)
+        os.chmod(tmp.name, _BLOB_MODE)  # NamedTemporaryFile defaults to 0600
+
+        # Publish via hard link: atomically fails with FileExistsError when
+        # another importer won the race, so both cannot claim the same blob.
+        try:
+            os.link(tmp.name, blob_path)
+        except FileExistsError:
+            pass
+        except OSError:  # pragma: no cover – filesystem without hard links
+            if not blob_path.exists():
+                os.replace(tmp.name, blob_path)
+                written.append(blob_path)
+                return f"blobs/{digest}"
+        else:
             written.append(blob_path)
+        os.unlink(tmp.name)
 
         return f"blobs/{digest}"
 
-    cleaned = _DATA_URI_RE.sub(_replace, html)
+    # Emit segment-at-a-time instead of ``re.sub`` so untouched text is copied
+    # exactly once and image-free documents are returned as-is.
+    out = io.StringIO()
+    last_end = 0
+    for match in _DATA_URI_RE.finditer(html):
+        out.write(html[last_end : match.start()])
+        out.write(_replace(match))
+        last_end = match.end()
+
+    if not last_end:
+        return html, written
+
+    out.write(html[last_end:])
+    cleaned = out.getvalue()
 
     return cleaned, written
 
@@ -72,6 +141,21 @@ def normalise_html(html: str, blobs_dir: os.PathLike[str] | str) -> Tuple[str, l
 # ---------------------------------------------------------------------------
 
 
+def _to_utc(timestamp: int | float | datetime) -> datetime:
+    """Return *timestamp* as an aware UTC :class:`datetime`."""
+
+    if isinstance(timestamp, (int, float)):
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    if isinstance(timestamp, datetime):
+        return timestamp.astimezone(timezone.utc)
+    raise TypeError("timestamp must be int, float, or datetime")
+
+
+def _commit_message(doc_title: str, ts_dt: datetime) -> str:
+    # ISO 8601 timestamp keeps messages reproducible across imports.
+    return f"{doc_title} – imported revision at {ts_dt.isoformat()}"
+
+
 class BranchRepo:
     """A thin wrapper around *GitPython* that manages Branch commits."""
 
@@ -85,6 +169,17 @@ class BranchRepo:
             # Either path not a repo or other issue – initialise a new one.
             self.repo = Repo.init(self.root)
 
+        # Optional libgit2 backend for staging + committing, opted into via
+        # ``BRANCH_GIT_BACKEND=pygit2``; GitPython stays the default.
+        self._pygit2_repo = None
+        if os.environ.get("BRANCH_GIT_BACKEND", "").lower() == "pygit2":
+            try:
+                import pygit2  # type: ignore  # noqa: WPS433 – optional backend
+            except ImportError:  # pragma: no cover – fall back to GitPython
+                pass
+            else:
+                self._pygit2_repo = pygit2.Repository(str(self.root))
+
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
@@ -117,40 +212,139 @@ class BranchRepo:
         doc_path = doc_dir / "doc.html"
 
         # Skip filesystem write if content unchanged (optimisation).
-        if not doc_path.exists() or doc_path.read_text(encoding="utf-8") != cleaned_html:
+        digest = hashlib.sha256(cleaned_html.encode("utf-8")).hexdigest()
+        hash_path = Path(self.repo.git_dir) / _HASH_CACHE_DIR / f"{slug}.sha256"
+        if not self._doc_matches(doc_path, hash_path, digest, cleaned_html):
             doc_path.write_text(cleaned_html, encoding="utf-8")
-
-        # 3. Stage files – we *always* git-add to ensure metadata gets updated.
-        self.repo.git.add(doc_path.relative_to(self.root))
-        # Add new blobs, too.
-        if blobs_dir.exists():
-            self.repo.git.add(blobs_dir.relative_to(self.root))
-
-        # 4. Commit only if tree changed
-        if not self.repo.is_dirty(untracked_files=True):
-            return self.repo.head.commit.hexsha
+            self._record_doc_hash(doc_path, hash_path, digest)
+
+        doc_rel = doc_path.relative_to(self.root).as_posix()
+        blob_rels = self._referenced_blobs(cleaned_html, blobs_dir)
+
+        if self._pygit2_repo is not None:
+            return self._commit_pygit2(
+                doc_rel, blob_rels, doc_title, author_email, timestamp
+            )
+
+        # 3. Stage files in-process – we *always* add doc.html to ensure
+        #    metadata gets updated, plus every referenced blob not yet tracked
+        #    (including ones left behind by an interrupted run).
+        index = self.repo.index
+        untracked = [p for p in blob_rels if (p, 0) not in index.entries]
+        index.add([doc_rel, *untracked], write=False)
+        index.write()
+
+        # 4. Commit only if tree changed – compare the staged tree with HEAD's
+        #    in-process instead of shelling out to ``git status``.
+        head = self.repo.head.commit if self.repo.head.is_valid() else None
+        if head is not None and index.write_tree().binsha == head.tree.binsha:
+            return head.hexsha
 
         author = Actor(author_email, author_email)
 
-        # Convert timestamp into ISO 8601 string for reproducibility.
-        if isinstance(timestamp, (int, float)):
-            ts_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        elif isinstance(timestamp, datetime):
-            ts_dt = timestamp.astimezone(timezone.utc)
-        else:
-            raise TypeError("timestamp must be int, float, or datetime")
-
-        ts_iso = ts_dt.isoformat()
+        ts_dt = _to_utc(timestamp)
 
         # Git expects "<Unix epoch> <tz offset>".
         epoch = int(ts_dt.timestamp())
         git_date_str = f"{epoch} +0000"
 
-        commit = self.repo.index.commit(
-            message=f"{doc_title} – imported revision at {ts_iso}",
+        commit = index.commit(
+            message=_commit_message(doc_title, ts_dt),
             author=author,
             commit_date=git_date_str,
             author_date=git_date_str,
         )
 
         return commit.hexsha
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _commit_pygit2(
+        self,
+        doc_rel: str,
+        blob_rels: list[str],
+        doc_title: str,
+        author_email: str,
+        timestamp: int | float | datetime,
+    ) -> str:
+        """libgit2 flavour of steps 3–4 of :meth:`commit_revision` (no forks)."""
+
+        import pygit2  # type: ignore  # noqa: WPS433 – optional backend
+
+        repo = self._pygit2_repo
+        index = repo.index
+        index.read()  # GitPython (or the user) may have touched it since
+        index.add(doc_rel)
+        for rel_path in blob_rels:
+            if rel_path not in index:
+                index.add(rel_path)
+        index.write()
+        tree_oid = index.write_tree()
+
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        if parents and repo[parents[0]].tree_id == tree_oid:
+            return str(parents[0])
+
+        ts_dt = _to_utc(timestamp)
+        epoch = int(ts_dt.timestamp())
+        author = pygit2.Signature(author_email, author_email, epoch, 0)
+        # Resolve the committer exactly like GitPython's ``index.commit`` does
+        # (env vars, git config, then user@host) so both backends agree.
+        actor = Actor.committer(self.repo.config_reader())
+        committer = pygit2.Signature(actor.name, actor.email, epoch, 0)
+
+        oid = repo.create_commit(
+            "HEAD", author, committer, _commit_message(doc_title, ts_dt), tree_oid, parents
+        )
+        return str(oid)
+
+    def _referenced_blobs(self, cleaned_html: str, blobs_dir: Path) -> list[str]:
+        """Return repo-relative paths of the on-disk blobs *cleaned_html* links to."""
+
+        if "blobs/" not in cleaned_html:
+            return []
+
+        paths = []
+        for digest in dict.fromkeys(_BLOB_REF_RE.findall(cleaned_html)):
+            blob_path = blobs_dir / digest
+            if blob_path.is_file():
+                paths.append(blob_path.relative_to(self.root).as_posix())
+        return paths
+
+    @staticmethod
+    def _doc_matches(doc_path: Path, hash_path: Path, digest: str, html: str) -> bool:
+        """Return ``True`` if *doc_path* already holds content hashing to *digest*.
+
+        The sidecar at *hash_path* records ``"<sha256> <size> <mtime_ns>"`` of
+        the last write; as long as the file's stat still matches we trust the
+        recorded hash and never read the (potentially large) old document.
+        """
+
+        try:
+            st = doc_path.stat()
+        except FileNotFoundError:
+            return False
+
+        try:
+            recorded, size, mtime_ns = hash_path.read_text().split()
+            if int(size) == st.st_size and int(mtime_ns) == st.st_mtime_ns:
+                return recorded == digest
+        except (OSError, ValueError):
+            pass
+
+        # No (or stale) sidecar – fall back to a full comparison.
+        if doc_path.read_text(encoding="utf-8") != html:
+            return False
+        BranchRepo._record_doc_hash(doc_path, hash_path, digest)
+        return True
+
+    @staticmethod
+    def _record_doc_hash(doc_path: Path, hash_path: Path, digest: str) -> None:
+        st = doc_path.stat()
+        try:
+            hash_path.parent.mkdir(parents=True, exist_ok=True)
+            hash_path.write_text(f"{digest} {st.st_size} {st.st_mtime_ns}\n")
+        except OSError:  # pragma: no cover – sidecar is only an optimisation
+            pass
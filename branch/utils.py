@@ -6,28 +6,47 @@ modules stay concise.
 
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 
 
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]+")
+
+
+@functools.lru_cache(maxsize=4)
+def _sep_run_re(sep: str) -> re.Pattern[str]:
+    """Return a compiled pattern matching runs of *sep*."""
+
+    return re.compile(fr"{re.escape(sep)}+")
+
+
 # ---------------------------------------------------------------------------
 # Public helpers
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=256)
 def slugify(text: str, sep: str = "-") -> str:
     """Return a filesystem-safe, ASCII-only slug derived from *text*.
 
     The implementation purposefully stays *simple*: we normalise the string to
     NFKD, drop non-ASCII characters, replace groups of *unsafe* characters with
     a single *sep* and strip leading/trailing separators.
+
+    Results are memoised: importers call this with the same title for every
+    revision.
     """
 
+    # Fast path: plain ASCII words separated by spaces need no normalisation.
+    if text.isascii() and text.replace(" ", "").isalnum():
+        return sep.join(text.split())
+
     # Decompose, drop accents then purge non-ASCII chars.
     text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
 
     # Replace any non-alnum run with *sep*, collapse multiples, then trim.
-    text = re.sub(r"[^A-Za-z0-9]+", sep, text)
-    text = re.sub(fr"{re.escape(sep)}+", sep, text).strip(sep)
+    text = _UNSAFE_RE.sub(sep, text)
+    text = _sep_run_re(sep).sub(sep, text).strip(sep)
 
     return text or "untitled"  # guarantee non-empty